@@ -0,0 +1,79 @@
+import argparse
+import tracemalloc
+
+from dictionary import load_words
+from word_search import WordSearch, Placement
+
+parser = argparse.ArgumentParser(
+    prog="bench_memory.py",
+    description="Reports how many bytes each board takes in memory. "
+                "Compares the old layout (plain objects, words as lists) with the slotted Placement records.",
+)
+
+parser.add_argument("--boards", "-b", type=int, default=10000, help="number of boards to keep in memory. Default 10000")
+parser.add_argument("--templates", "-t", type=int, default=5,
+                    help="number of boards to generate. The rest are copies of these. Default 5")
+parser.add_argument("--words", "-w", type=int, default=10, dest="num_of_words", help="number of words. Default 10")
+parser.add_argument("--dictionary", "-d", default="words_dictionary.json",
+                    help="dictionary file. Default words_dictionary.json")
+
+
+class _LegacyWordSearch:
+    """How WordSearch was stored before. Has a __dict__ and keeps every word as [(x, y), (x, y), bool]"""
+    def __init__(self, mapper, words):
+        self.mapper = mapper
+        self.words = words
+
+
+def _fresh(coord):
+    """New (x, y) tuple. Boards that are generated don't share these, so the copies shouldn't either"""
+    return coord[0], coord[1]
+
+
+def _legacy_copy(word_search):
+    # Built the way generate used to, [(x, y), (x, y), bool]
+    words = {k: [_fresh(v.start), _fresh(v.end), v.found] for k, v in word_search.words.items()}
+    return _LegacyWordSearch([list(row) for row in word_search.mapper], words)
+
+
+def _slotted_copy(word_search):
+    # Built the way generate does, with a new (t_x, t_y) tuple that Placement swaps for a shared one
+    copy = WordSearch()
+    copy.mapper = [list(row) for row in word_search.mapper]
+    copy.words = {
+        k: Placement(_fresh(v.start), _fresh(v.end), _fresh(v.direction), v.found) for k, v in word_search.words.items()
+    }
+    return copy
+
+
+def bytes_per_board(templates, boards, copy):
+    """
+    Keeps number of boards in memory and measures how much memory they take
+
+    :param templates:   list of WordSearch to copy
+    :param boards:      int, number of boards to create
+    :param copy:        function that copies a WordSearch into the layout being measured
+    :return:            float, bytes per board
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [copy(templates[i % len(templates)]) for i in range(boards)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del kept
+    return (after - before) / boards
+
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+    words = load_words(arguments.dictionary, min_word_width=3)
+
+    templates = [WordSearch.generate(words, num_of_words=arguments.num_of_words) for _ in range(arguments.templates)]
+
+    before = bytes_per_board(templates, arguments.boards, _legacy_copy)
+    after = bytes_per_board(templates, arguments.boards, _slotted_copy)
+
+    print(f"before: {before:,.0f} bytes per board")
+    print(f"after:  {after:,.0f} bytes per board")
+    print(f"saved:  {before - after:,.0f} bytes per board ({(before - after) / before:.1%})")
@@ -0,0 +1,222 @@
+import argparse
+import gzip
+import io
+import json
+import re
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+# Strings in a json file. _JSON_KEY only matches the keys of an object, like {"word": 1}
+_JSON_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+_JSON_KEY = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:')
+
+parser = argparse.ArgumentParser(
+    prog="dictionary.py",
+    description="Loads a dictionary and reports how long it took and the peak memory used. "
+                "Supports .json (object or list), text with one word per line, and gzip of either.",
+)
+
+parser.add_argument("filename", help="dictionary to load")
+parser.add_argument("--min", type=int, default=1, dest="min_word_width", help="min word's width. Default 1")
+parser.add_argument("--max", type=int, default=None, dest="max_word_width", help="max word's width")
+
+
+class WordPool(Sequence):
+    """
+    Compact list of words. Every word is stored in one string, sorted, with an array of where each word starts.
+    This takes a lot less memory than a list of strings.
+
+    Works like a list, so random.choice can pick from it. Checking if a word is in the pool uses a binary search.
+    """
+    __slots__ = ("text", "offsets")
+
+    def __init__(self, words):
+        """
+        :param words: iterable of words. Duplicates are removed. Words can't have new lines
+        """
+        # Sorting backwards so the smallest word can be popped from the end. Popping lets each word be freed
+        # once it's in text, so there is only one full copy of the words at a time
+        words = sorted(words, reverse=True)
+        text = io.StringIO()
+
+        # Start of each word in text, plus the end of text so word i is text[offsets[i]:offsets[i + 1] - 1]
+        self.offsets = array('L', [0])
+        previous = None
+        while words:
+            word = words.pop()
+            if word == previous:
+                # Sorted, so duplicates are next to each other
+                continue
+
+            text.write(word + "\n")
+            self.offsets.append(self.offsets[-1] + len(word) + 1)
+            previous = word
+
+        self.text = text.getvalue()[:-1]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WordPool index out of range")
+
+        return self.text[self.offsets[index]:self.offsets[index + 1] - 1]
+
+    def _find(self, word):
+        """Binary search. Returns where the word is, or would be if it's not in the pool"""
+        return bisect_left(self, word)
+
+    def __contains__(self, word):
+        index = self._find(word)
+        return index < len(self) and self[index] == word
+
+    def has_prefix(self, prefix):
+        """
+        Checks if any word starts with prefix. Used by WordSearch.extra_words to stop searching early
+
+        :param prefix:  str
+        :return:        bool
+        """
+        index = self._find(prefix)
+        return index < len(self) and self[index].startswith(prefix)
+
+
+def _open(filename):
+    """Opens the file as text. Checks if the file is gzip by the first 2 bytes"""
+    with open(filename, 'rb') as fp:
+        is_gzip = fp.read(2) == b"\x1f\x8b"
+
+    if is_gzip:
+        return gzip.open(filename, 'rt', encoding="utf-8", errors="replace")
+    return open(filename, 'r', encoding="utf-8", errors="replace")
+
+
+def _read_chunks(fp, chunk_size):
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _json_words(chunks):
+    """
+    Grabs the words from a json object (the keys) or list, a chunk at a time.
+    Made for https://github.com/dwyl/english-words's words_dictionary.json, without loading the whole file.
+    """
+    buffer = ""
+    pattern = None
+    for chunk in chunks:
+        buffer += chunk
+        if pattern is None:
+            # Checking the first character to know if it's an object or list
+            pattern = _JSON_KEY if buffer.lstrip()[:1] == "{" else _JSON_STRING
+
+        end = 0
+        for match in pattern.finditer(buffer):
+            word = match.group(1)
+            if "\\" in word:
+                word = json.loads(f'"{word}"')
+            yield word
+            end = match.end()
+
+        # Keeping what's left. It might be part of a word that continues in the next chunk
+        buffer = buffer[end:]
+
+
+def _line_words(chunks):
+    """Grabs the words from text, one word per line"""
+    buffer = ""
+    for chunk in chunks:
+        lines = (buffer + chunk).split("\n")
+        # The last line might continue in the next chunk
+        buffer = lines.pop()
+        yield from lines
+
+    yield buffer
+
+
+def read_words(filename, chunk_size=1 << 16):
+    """
+    Reads the words from the file without loading the whole file.
+    Supports .json (object or list), text with one word per line, and gzip of either.
+
+    :param filename:    str, name of file to open
+    :param chunk_size:  int, how many characters to read at once
+    :return:            generator of str
+    """
+    with _open(filename) as fp:
+        first = fp.read(chunk_size)
+        chunks = _read_chunks(fp, chunk_size)
+
+        if first.lstrip()[:1] in ("{", "["):
+            yield from _json_words(_chain(first, chunks))
+        else:
+            yield from _line_words(_chain(first, chunks))
+
+
+def _chain(first, chunks):
+    yield first
+    yield from chunks
+
+
+def normalize(words):
+    """Removes spaces around the words and makes them lowercase"""
+    for word in words:
+        yield word.strip().lower()
+
+
+def filter_words(words, min_word_width=1, max_word_width=None):
+    """
+    Only keeps words that can go on the board. Letters a to z, with a width between min and max
+
+    :param words:           iterable of str
+    :param min_word_width:  int, min word's width
+    :param max_word_width:  int, max word's width. No max if None
+    """
+    for word in words:
+        if len(word) < min_word_width or (max_word_width is not None and len(word) > max_word_width):
+            continue
+        if word.isascii() and word.isalpha():
+            yield word
+
+
+def load_words(filename, min_word_width=1, max_word_width=None):
+    """
+    Loads the dictionary into a WordPool. The words go through normalize -> filter_words while reading.
+    WordPool removes the duplicates after sorting, so there isn't a set of every word while reading.
+
+    :param filename:        str, name of file to open
+    :param min_word_width:  int, min word's width
+    :param max_word_width:  int, max word's width. No max if None
+    :return:                WordPool
+    """
+    words = filter_words(normalize(read_words(filename)), min_word_width, max_word_width)
+    return WordPool(words)
+
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+
+    start = time.perf_counter()
+    pool = load_words(**vars(arguments))
+    seconds = time.perf_counter() - start
+
+    # Loading again to measure the memory. tracemalloc makes it slower, so this isn't timed
+    del pool
+    tracemalloc.start()
+    pool = load_words(**vars(arguments))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{len(pool)} words loaded in {seconds:.2f}s")
+    print(f"peak memory: {peak / 1024 ** 2:.1f} MiB | pool: {current / 1024 ** 2:.1f} MiB")
@@ -1,6 +1,7 @@
 import datetime
 
 import blessed
+from word_panel import WordPanel
 from word_search import WordSearch
 
 # TODO: Stop Game when all words are found
@@ -10,9 +11,19 @@ from word_search import WordSearch
 
 
 class Game:
-    def __init__(self, word_search: WordSearch):
+    __slots__ = ("word_search", "terminal", "keys", "positions", "current_mapper", "found_coords", "select", "cursor",
+                 "off_set", "selected_word", "selected_coords", "word_panel", "word_offset", "info", "started",
+                 "window_too_small", "recorder")
+
+    def __init__(self, word_search: WordSearch, terminal=None, recorder=None):
+        """
+        :param word_search: WordSearch, the board to play
+        :param terminal:    blessed.Terminal, terminal to play in. Creates one if None
+        :param recorder:    replay.Recorder, records the keys pressed so it can be replayed later. Doesn't record if None
+        """
         self.word_search = word_search
-        self.terminal = blessed.Terminal()
+        self.terminal = blessed.Terminal() if terminal is None else terminal
+        self.recorder = recorder
 
         self.keys = {
             # code - (method, args)
@@ -38,17 +49,18 @@ class Game:
         self.current_mapper = {"mapper": [[]], "top": "", "side_spacing": 0}
 
         # TODO: Maybe allow custom colors to coordinates. So, don't have a lot of lists for each color
-        #   {[x, y]: string from terminal.color}
-        self.found_coords = []
-        self.select = []
-        self.cursor = [0, 0]
-        self.off_set = [0, 0]
+        #   {(x, y): string from terminal.color}
+        # Coordinates are kept as (x, y) tuples
+        self.found_coords = set()
+        self.select = ()
+        self.cursor = (0, 0)
+        self.off_set = (0, 0)
 
         # TODO: Remove selected_word and use self.info
         self.selected_word = ""
         self.selected_coords = []
 
-        self.word_rows = []
+        self.word_panel = WordPanel(self.terminal, self.word_search.words)
         self.word_offset = 0
 
         self.info = ""
@@ -66,7 +78,7 @@ class Game:
         :param b_x: x coordinate of b
         :param b_y: y coordinate of b
 
-        :return: list of coordinates
+        :return: list of (x, y) coordinates
         """
 
         # This is a bit confusing and hard to read. Mainly because all variables used are single letter
@@ -108,7 +120,7 @@ class Game:
         if m is not None:
             for x in range(a_x, b_x + 1):
                 y = round(m * x + b)
-                coords.append([x, y])
+                coords.append((x, y))
 
         # Finding x values for y
         if m != 0:
@@ -122,7 +134,7 @@ class Game:
                 # Adding the coord to the coords list.
                 # Checking if the coord is already in the list. Then put it in order.
                 # This is mainly so we can easily grab the word that was selected.
-                cord = [x, y]
+                cord = (x, y)
                 if cord not in coords:
                     added = False
                     for k, c in enumerate(coords):
@@ -250,13 +262,13 @@ class Game:
 
             for x, val in enumerate(row):
                 x += self.off_set[0]
-                if [x, y] == self.cursor:
+                if (x, y) == self.cursor:
                     # Highlighting the cursor
                     string += self.terminal.reverse(val)
-                elif [x, y] in self.selected_coords:
+                elif (x, y) in self.selected_coords:
                     # user is selecting between two coordinates
                     string += self.terminal.white_on_green(val)
-                elif [x, y] in self.found_coords:
+                elif (x, y) in self.found_coords:
                     # Highlighting the found words
                     string += self.terminal.white_on_blue(val)
                 else:
@@ -267,32 +279,11 @@ class Game:
         return self.terminal.move_xy(0, 0) + string
 
     def _set_words(self):
-        self.word_rows = []
         width = self.terminal.width - 2  # subtract 2 to give room to add the arrows
-
-        rows = [[]]
-        cur_width = 0
-
-        for word in self.word_search.words:
-            word_width = len(word) + 2
-
-            # Checking if the word is found
-            if self.word_search.words[word][2]:
-                word = self.terminal.white_on_blue(word)
-
-            # Adding the word by checking if it can fit in the current row
-            if width <= cur_width + word_width:
-                rows.append([word])
-                cur_width = word_width
-            else:
-                rows[-1].append(word)
-                cur_width += word_width
-
-        for r in rows:
-            self.word_rows.append(", ".join(r))
+        self.word_panel.resize(width)
 
         # Checking if the offset is outside. Just in case the screen was resized
-        if self.word_offset > len(self.word_rows) - 1:
+        if self.word_offset > self.word_panel.row_count - 1:
             self.word_offset = 0
 
     def _grab_words(self):
@@ -300,20 +291,22 @@ class Game:
         coord[1] += 2
 
         max_rows = (self.terminal.height - coord[1]) - 1
+        row_count = self.word_panel.row_count
 
-        if max_rows >= len(self.word_rows):
-            rows = self.word_rows
+        if max_rows >= row_count:
+            rows = self.word_panel.rows(0, row_count)
         else:
-            rows = self.word_rows[self.word_offset:max_rows + self.word_offset]
+            # Only the rows that fit on the screen are created
+            rows = self.word_panel.rows(self.word_offset, max_rows)
             # Adding the arrows
             # Checking if there are any words hidden above
-            if self.word_offset > 0:
-                width = self.terminal.width - len(rows[0])
+            if self.word_offset > 0 and rows:
+                width = self.terminal.width - self.terminal.length(rows[0])
                 rows[0] += self.terminal.rjust("▲", width)
 
             # Checking if there are anymore words hidden on the bottom
-            if len(self.word_rows) - self.word_offset > max_rows:
-                width = self.terminal.width - len(rows[-1])
+            if row_count - self.word_offset > max_rows and rows:
+                width = self.terminal.width - self.terminal.length(rows[-1])
                 rows[-1] += self.terminal.rjust("▼", width)
 
         string = "\n".join(rows)
@@ -390,6 +383,12 @@ class Game:
             number += adding
             return min_num <= number < max_num
 
+        def shift(coord, index, adding):
+            # Coordinates are tuples, so this returns a new one with coord[index] changed
+            coord = list(coord)
+            coord[index] += adding
+            return tuple(coord)
+
         # Setting t_x, t_y with args tuple. To allow to check it in the for loop below
         args = (t_x, t_y)
         mapper = self.current_mapper['mapper']
@@ -404,15 +403,15 @@ class Game:
             # Checking if the coordinate isn't outside the resized mapper grid
             if check(v, self.off_set[k], max_coord[k] + self.off_set[k], args[k]):
                 # Its still inside, move the cursor
-                self.cursor[k] += args[k]
+                self.cursor = shift(self.cursor, k, args[k])
 
             # Checking if the coordinate isn't outside the grid
             elif check(v, 0, extended_mapper[k], args[k]):
                 # Its still inside, need to off_set then resize
-                self.off_set[k] += args[k]
+                self.off_set = shift(self.off_set, k, args[k])
                 self._resize_mapper()
                 # Moving the cursor
-                self.cursor[k] += args[k]
+                self.cursor = shift(self.cursor, k, args[k])
 
     def _move_words(self, offset):
         self.word_offset += offset
@@ -420,23 +419,25 @@ class Game:
         if self.word_offset < 0:
             self.word_offset = 0
 
-        elif self.word_offset >= len(self.word_rows):
-            self.word_offset = len(self.word_rows) - 1
+        elif self.word_offset >= self.word_panel.row_count:
+            self.word_offset = max(0, self.word_panel.row_count - 1)
 
     def _select(self):
         if self.select:
             # TODO: if its already found, don't add coordinates
-            found = self.word_search.answer(*self.cursor, *self.select)
-            if not found:
-                found = self.word_search.answer(*self.select, *self.cursor)
+            word = self.word_search.find_word(*self.cursor, *self.select)
+            if word is None:
+                word = self.word_search.find_word(*self.select, *self.cursor)
 
-            if found:
-                self.found_coords += self.selected_coords
-                self._set_words()
+            if word is not None:
+                self.word_search.words[word].found = True
+                self.found_coords.update(self.selected_coords)
+                # Only the row with the word needs to change
+                self.word_panel.update(word)
 
-            self.select = []
+            self.select = ()
         else:
-            self.select = list(self.cursor)
+            self.select = self.cursor
 
     def start(self):
         while True:
@@ -448,6 +449,8 @@ class Game:
                 val = ''
                 while val.lower() != 'q':
                     val = self.terminal.inkey(timeout=1)
+                    if self.recorder is not None:
+                        self.recorder.record(val, self.terminal.width, self.terminal.height)
 
                     if val in self.keys:
                         run, args = self.keys[val][0], self.keys[val][1:]
@@ -460,7 +463,7 @@ class Game:
                         break
             if val == 'q':
                 break
-            self.cursor = list(self.off_set)
+            self.cursor = self.off_set
 
     def load_key_config(self):
         pass
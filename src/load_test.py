@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import random
+import time
+
+from stats import percentile
+
+parser = argparse.ArgumentParser(
+    prog="load_test.py",
+    description="Load test for the word search server (main.py serve). "
+                "Reports the requests per second and the p99 latency.",
+)
+
+parser.add_argument("--host", default="127.0.0.1", help="server's host. Default 127.0.0.1")
+parser.add_argument("--port", "-p", type=int, default=8765, help="server's port. Default 8765")
+parser.add_argument("--clients", "-c", type=int, default=50, help="number of players at once. Default 50")
+parser.add_argument("--duration", "-d", type=float, default=10, help="how many seconds to run for. Default 10")
+
+
+async def _request(reader, writer, line, latencies):
+    start = time.perf_counter()
+    writer.write((line + "\n").encode())
+    await writer.drain()
+    response = (await reader.readline()).decode().strip()
+    latencies.append(time.perf_counter() - start)
+
+    if not response.startswith("OK"):
+        raise RuntimeError(f"{line} -> {response}")
+
+    return response[3:]
+
+
+async def _client(host, port, stop_at, latencies, new_latencies):
+    """
+    Plays a board like a player would. Grabs the board, answers random coordinates and checks the progress.
+    NEW is timed separately, since creating the board takes a lot longer than the other requests.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        session_id = await _request(reader, writer, "NEW", new_latencies)
+
+        while time.perf_counter() < stop_at:
+            board = await _request(reader, writer, f"BOARD {session_id}", latencies)
+            width, height = (int(v) for v in board.split()[:2])
+
+            coords = [random.randrange(width), random.randrange(height),
+                      random.randrange(width), random.randrange(height)]
+            await _request(reader, writer, f"ANSWER {session_id} {' '.join(map(str, coords))}", latencies)
+            await _request(reader, writer, f"PROGRESS {session_id}", latencies)
+
+        writer.write(b"QUIT\n")
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def run(host="127.0.0.1", port=8765, clients=50, duration=10):
+    """
+    Runs the load test
+
+    The requests don't include NEW. It has its own p99 in new_p99_ms.
+
+    :return: dict -- {'requests': int, 'seconds': float, 'requests_per_second': float, 'p99_ms': float,
+                      'new_p99_ms': float}
+    """
+    latencies = []
+    new_latencies = []
+    start = time.perf_counter()
+    stop_at = start + duration
+
+    await asyncio.gather(*(_client(host, port, stop_at, latencies, new_latencies) for _ in range(clients)))
+    seconds = time.perf_counter() - start
+
+    return {
+        "requests": len(latencies),
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else 0,
+        "new_p99_ms": percentile(new_latencies, 99) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+    result = asyncio.run(run(**vars(arguments)))
+    print(f"{result['requests']} requests in {result['seconds']:.2f}s")
+    print(f"{result['requests_per_second']:.1f} requests/s")
+    print(f"p99 latency: {result['p99_ms']:.2f}ms")
+    print(f"p99 NEW latency (creating the board): {result['new_p99_ms']:.2f}ms")
@@ -1,5 +1,8 @@
 import argparse
-from game import Game
+import asyncio
+import json
+import sys
+import time
 from word_search import WordSearch
 
 parser = argparse.ArgumentParser(
@@ -8,21 +11,130 @@ parser = argparse.ArgumentParser(
                 "if the word doesn't fit then it'll extend the board. You can determine by how much by using --extend",
 )
 
-parser.add_argument("--width", "-W", type=int, default=10, help="min width of the game")
-parser.add_argument("--height", "-H", type=int, default=10, help="min height of the game")
-parser.add_argument("--words", "-w", type=int, default=10, dest="num_of_words", help="number of words. Default 10")
-parser.add_argument("--extend", "-e", type=int, default=5, dest="extend_by",
-                    help="When a word doesn't fit, it'll extend the board by amount")
-parser.add_argument("-l", action="store_false", dest="add_letters",
-                    help="Remove letters from the board. Exposing the added words.")
 
-if __name__ == "__main__":
-    arguments = parser.parse_args()
+def add_board_arguments(to_parser, subcommand=False):
+    """
+    Options for generating a board. Shared with the subcommands that create boards
+
+    :param to_parser:   argparse.ArgumentParser to add the options to
+    :param subcommand:  bool, if True the defaults are left out. Otherwise the subcommand's defaults would replace
+                        the options given before the subcommand, like the 20 in: main.py -W 20 serve
+    """
+    def default(value):
+        return argparse.SUPPRESS if subcommand else value
+
+    to_parser.add_argument("--width", "-W", type=int, default=default(10), help="min width of the game")
+    to_parser.add_argument("--height", "-H", type=int, default=default(10), help="min height of the game")
+    to_parser.add_argument("--words", "-w", type=int, default=default(10), dest="num_of_words",
+                           help="number of words. Default 10")
+    to_parser.add_argument("--extend", "-e", type=int, default=default(5), dest="extend_by",
+                           help="When a word doesn't fit, it'll extend the board by amount")
+    to_parser.add_argument("-l", action="store_false", dest="add_letters", default=default(True),
+                           help="Remove letters from the board. Exposing the added words.")
+    to_parser.add_argument("--dictionary", "-D", default=default("words_dictionary.json"),
+                           help="file to grab the words from. Can be .json, one word per line, or gzip of either. "
+                                "Default words_dictionary.json")
+
+
+add_board_arguments(parser)
+parser.add_argument("--processes", "-P", type=int, default=None,
+                    help="Split the board into regions and add the words with this many processes. "
+                         "Faster for boards with thousands of words")
+parser.add_argument("--record", metavar="FILE", default=None,
+                    help="Record the keys pressed to FILE. Can be replayed with replay.py")
+
+subparsers = parser.add_subparsers(dest="command", title="commands",
+                                   description="Leave empty to play the game in the terminal")
+
+serve_parser = subparsers.add_parser("serve", help="Host the game over TCP for many players at once")
+add_board_arguments(serve_parser, subcommand=True)
+serve_parser.add_argument("--host", default="127.0.0.1", help="host to listen on. Default 127.0.0.1")
+serve_parser.add_argument("--port", "-p", type=int, default=8765, help="port to listen on. Default 8765")
+serve_parser.add_argument("--sessions", "-s", type=int, default=10000, dest="max_sessions",
+                          help="number of boards to keep in memory. Default 10000")
+serve_parser.add_argument("--processes", "-P", type=int, default=argparse.SUPPRESS,
+                          help="number of processes generating boards. Default is the number of cores")
+
+solve_parser = subparsers.add_parser("solve", help="Search saved boards for extra words, using every core")
+solve_parser.add_argument("boards", nargs="+",
+                          help="files with boards saved by WordSearch.to_dict, one per line. "
+                               "Files from --record also work")
+solve_parser.add_argument("--dictionary", "-D", default=argparse.SUPPRESS,
+                          help="file to grab the words from. Default words_dictionary.json")
+solve_parser.add_argument("--min", type=int, default=3, dest="min_word_width", help="min word's width. Default 3")
+solve_parser.add_argument("--processes", "-P", type=int, default=argparse.SUPPRESS,
+                          help="number of processes. Default is the number of cores")
+solve_parser.add_argument("--output", "-o", metavar="FILE", default=None,
+                          help="save the extra words to FILE. One json object per board, per line")
+
+
+def play(arguments):
+    from game import Game
+    from replay import Recorder
+
+    record = arguments.pop("record")
+    try:
+        word_search = WordSearch.generate_json(arguments.pop("dictionary"), **arguments)
+    except ValueError as e:
+        print(e)
+    else:
+        recorder = None if record is None else Recorder(record, word_search)
+        try:
+            Game(word_search, recorder=recorder).start()
+        finally:
+            if recorder is not None:
+                recorder.close()
+
+
+def serve(arguments):
+    from server import PuzzleServer
+
+    arguments.pop("record")
+    host, port = arguments.pop("host"), arguments.pop("port")
     try:
-        word_search = WordSearch.generate_json("words_dictionary.json", **vars(arguments))
+        server = PuzzleServer.from_file(arguments.pop("dictionary"), **arguments)
     except ValueError as e:
         print(e)
     else:
-        game = Game(word_search).start()
+        try:
+            asyncio.run(server.serve(host, port))
+        except KeyboardInterrupt:
+            pass
+
+
+def solve(arguments):
+    from dictionary import load_words
+    from solver import load_boards, solve_boards
+
+    def progress(done, total, seconds):
+        print(f"\r{done / total:.0%} | {done}/{total} rays | {done / seconds:,.0f} rays/s",
+              end="", file=sys.stderr, flush=True)
 
+    words = load_words(arguments["dictionary"], min_word_width=arguments["min_word_width"])
+    boards = [board for filename in arguments["boards"] for board in load_boards(filename)]
 
+    start = time.perf_counter()
+    results = solve_boards(boards, words, arguments["min_word_width"], arguments["processes"], progress)
+    seconds = time.perf_counter() - start
+    print(file=sys.stderr)
+
+    for number, extra in enumerate(results):
+        print(f"board {number}: {len(extra)} extra words")
+    print(f"{len(boards)} boards in {seconds:.2f}s ({len(boards) / seconds:.2f} boards/s)")
+
+    if arguments["output"] is not None:
+        with open(arguments["output"], 'w') as fp:
+            for extra in results:
+                fp.write(json.dumps(extra) + "\n")
+
+
+if __name__ == "__main__":
+    arguments = vars(parser.parse_args())
+    command = arguments.pop("command")
+
+    if command == "serve":
+        serve(arguments)
+    elif command == "solve":
+        solve(arguments)
+    else:
+        play(arguments)
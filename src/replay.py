@@ -0,0 +1,179 @@
+import argparse
+import contextlib
+import io
+import json
+import time
+
+import blessed
+from game import Game
+from stats import percentile
+from word_search import WordSearch
+
+parser = argparse.ArgumentParser(
+    prog="replay.py",
+    description="Replays a game recorded with main.py --record without a real terminal. "
+                "Reports how long each frame took to build and how many bytes it printed.",
+)
+
+parser.add_argument("recording", help="file made by main.py --record")
+parser.add_argument("--repeat", "-r", type=int, default=1, help="replay this many times and keep the fastest. Default 1")
+parser.add_argument("--json", action="store_true", help="print the results as json. Easier to compare versions")
+
+
+class Recorder:
+    """
+    Records the keys pressed and the terminal's size to a file. One json object per line.
+    The first line is the board, so the game can be replayed with the same board.
+    """
+    def __init__(self, filename, word_search):
+        self.fp = open(filename, 'w')
+        self.started = time.perf_counter()
+
+        self._write({"board": word_search.to_dict()})
+
+    def _write(self, data):
+        self.fp.write(json.dumps(data) + "\n")
+
+    def record(self, key, width, height):
+        """
+        :param key:     str, key given by terminal.inkey. Empty if nothing was pressed
+        :param width:   int, terminal's width
+        :param height:  int, terminal's height
+        """
+        self._write({"time": time.perf_counter() - self.started, "key": str(key), "width": width, "height": height})
+
+    def close(self):
+        self.fp.close()
+
+
+def load_recording(filename):
+    """
+    :param filename:    str, file made by Recorder
+    :return:            WordSearch, list of events -- [{'time': float, 'key': str, 'width': int, 'height': int}]
+    """
+    with open(filename, 'r') as fp:
+        word_search = WordSearch.from_dict(json.loads(fp.readline())["board"])
+        events = [json.loads(line) for line in fp if line.strip()]
+
+    return word_search, events
+
+
+class _ByteCounter(io.TextIOBase):
+    """Replaces stdout while replaying. Only counts the bytes printed"""
+    def __init__(self):
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, string):
+        self.bytes += len(string.encode())
+        return len(string)
+
+
+class ReplayTerminal(blessed.Terminal):
+    """
+    A terminal that plays back the recorded keys instead of reading the keyboard.
+    Every time the game asks for a key, the time and bytes printed since the last key are saved as a frame.
+    """
+    def __init__(self, events, output):
+        super().__init__(stream=io.StringIO(), force_styling=True)
+        self.events = iter(events)
+        self.output = output
+
+        first = events[0] if events else {"width": 80, "height": 24}
+        self.size = (first["width"], first["height"])
+
+        self.frames = [
+            # (seconds, bytes)
+        ]
+        self._frame_start = time.perf_counter()
+        self._frame_bytes = 0
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @contextlib.contextmanager
+    def _nothing(self):
+        yield
+
+    def fullscreen(self):
+        return self._nothing()
+
+    def cbreak(self):
+        return self._nothing()
+
+    def hidden_cursor(self):
+        return self._nothing()
+
+    def inkey(self, timeout=None, **kwargs):
+        # Everything since the last key is one frame
+        now = time.perf_counter()
+        self.frames.append((now - self._frame_start, self.output.bytes - self._frame_bytes))
+
+        event = next(self.events, None)
+        if event is None:
+            # Out of keys, quitting the game
+            key = 'q'
+        else:
+            key = event["key"]
+            self.size = (event["width"], event["height"])
+
+        self._frame_start = time.perf_counter()
+        self._frame_bytes = self.output.bytes
+        return key
+
+
+def replay(filename):
+    """
+    Replays the recording as fast as possible
+
+    :param filename:    str, file made by Recorder
+    :return:            dict -- results. Times are in milliseconds
+    """
+    word_search, events = load_recording(filename)
+    output = _ByteCounter()
+    terminal = ReplayTerminal(events, output)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        Game(word_search, terminal=terminal).start()
+    total = time.perf_counter() - start
+
+    build = [seconds * 1000 for seconds, _ in terminal.frames]
+    sizes = [size for _, size in terminal.frames]
+
+    return {
+        "frames": len(terminal.frames),
+        "total_ms": total * 1000,
+        "build_ms": {
+            "mean": sum(build) / len(build),
+            "p50": percentile(build, 50),
+            "p99": percentile(build, 99),
+            "max": max(build),
+        },
+        "bytes_per_frame": {
+            "mean": sum(sizes) / len(sizes),
+            "max": max(sizes),
+        },
+        "total_bytes": output.bytes,
+    }
+
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+    results = min((replay(arguments.recording) for _ in range(arguments.repeat)), key=lambda r: r["total_ms"])
+
+    if arguments.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{results['frames']} frames in {results['total_ms']:.2f}ms")
+        print(f"build time (ms): mean {results['build_ms']['mean']:.3f} | p50 {results['build_ms']['p50']:.3f} | "
+              f"p99 {results['build_ms']['p99']:.3f} | max {results['build_ms']['max']:.3f}")
+        print(f"bytes per frame: mean {results['bytes_per_frame']['mean']:.0f} | max {results['bytes_per_frame']['max']}")
+        print(f"total bytes: {results['total_bytes']}")
@@ -0,0 +1,198 @@
+import asyncio
+import secrets
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from dictionary import load_words
+from word_search import WordSearch
+
+# Words given to each worker process. Set once by _init_worker so the boards don't need the words sent every time
+_worker_words = None
+
+
+def _init_worker(words):
+    global _worker_words
+    _worker_words = words
+
+
+def _generate_board(kwargs):
+    """
+    Runs inside the process pool. Creates a new board with the words given to _init_worker
+
+    :param kwargs:  dict, **kwargs given to WordSearch.generate
+    :return:        WordSearch
+    """
+    return WordSearch.generate(_worker_words, **kwargs)
+
+
+class BoardError(Exception):
+    """This is raised when the process pool couldn't create a board"""
+    pass
+
+
+class SessionStore:
+    """
+    Keeps each session's WordSearch in memory.
+    When there is more than max_sessions, the session that was used the longest time ago is removed.
+    """
+    def __init__(self, max_sessions=10000):
+        if max_sessions <= 0:
+            raise ValueError("max_sessions must be greater than 0")
+
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()  # 'session_id': WordSearch -- Ordered from least to most recently used
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def add(self, word_search):
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = word_search
+
+        while len(self.sessions) > self.max_sessions:
+            # Removing the least recently used session
+            self.sessions.popitem(last=False)
+
+        return session_id
+
+    def get(self, session_id):
+        """
+        Grabs the session's WordSearch and marks it as recently used
+
+        :param session_id:  str, id given by add
+        :return:            WordSearch
+        """
+        word_search = self.sessions[session_id]
+        self.sessions.move_to_end(session_id)
+        return word_search
+
+
+class PuzzleServer:
+    """
+    asyncio TCP server for playing many word searches at once.
+
+    Every request and response is one line. Responses start with OK or ERR.
+
+    NEW                             -> OK <session_id>
+    BOARD <session_id>              -> OK <width> <height> <row/row/...> <word,word,...>
+    ANSWER <session_id> x y s_x s_y -> OK 1 if the word was found, OK 0 if not
+    PROGRESS <session_id>           -> OK <found> <total>
+    QUIT                            -> closes the connection
+    """
+    def __init__(self, words, max_sessions=10000, processes=None, **kwargs):
+        """
+        :param words:           list or WordPool of words to use. Loaded once and shared with every board
+        :param max_sessions:    int, how many boards to keep in memory
+        :param processes:       int, number of processes used to generate boards. Default is the number of cores
+        :param kwargs:          **kwargs given to WordSearch.generate
+        """
+        WordSearch.check_config(**kwargs)
+        WordSearch.check_words(words, **kwargs)
+
+        self.sessions = SessionStore(max_sessions)
+        self.generate_kwargs = kwargs
+        self.executor = ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(words, ))
+
+        self.commands = {
+            # name - (method, number of args)
+            "NEW": (self._new, 0),
+            "BOARD": (self._board, 1),
+            "ANSWER": (self._answer, 5),
+            "PROGRESS": (self._progress, 1),
+        }
+
+    @classmethod
+    def from_file(cls, filename, **kwargs):
+        """
+        Creates the server with a dictionary file. Same formats as WordSearch.generate_json
+
+        :param filename:  str, name of file to open
+        :param kwargs:    **kwargs given to PuzzleServer
+        :return:          PuzzleServer
+        """
+        words = load_words(filename, min_word_width=kwargs.get("min_word_width", 3))
+        return cls(words, **kwargs)
+
+    async def _new(self):
+        loop = asyncio.get_running_loop()
+        # Generating in the process pool so it doesn't block the other sessions
+        try:
+            word_search = await loop.run_in_executor(self.executor, _generate_board, self.generate_kwargs)
+        except Exception as e:
+            # Anything from the process pool. Like BrokenProcessPool
+            raise BoardError() from e
+        return self.sessions.add(word_search)
+
+    async def _board(self, session_id):
+        word_search = self.sessions.get(session_id)
+        rows = "/".join("".join(row) for row in word_search.mapper)
+        return f"{word_search.width} {word_search.height} {rows} {','.join(word_search.words)}"
+
+    async def _answer(self, session_id, x, y, s_x, s_y):
+        word_search = self.sessions.get(session_id)
+        found = word_search.answer(int(x), int(y), int(s_x), int(s_y))
+        return "1" if found else "0"
+
+    async def _progress(self, session_id):
+        word_search = self.sessions.get(session_id)
+        found = sum(1 for v in word_search.words.values() if v.found)
+        return f"{found} {len(word_search.words)}"
+
+    async def _run_command(self, line):
+        """
+        Runs one line from the client
+
+        :param line:    str, the request without the newline
+        :return:        str, the response without the newline
+        """
+        name, *args = line.split()
+        if name.upper() not in self.commands:
+            return f"ERR unknown command {name}"
+
+        run, num_of_args = self.commands[name.upper()]
+        if len(args) != num_of_args:
+            return f"ERR {name.upper()} takes {num_of_args} arguments"
+
+        try:
+            return f"OK {await run(*args)}"
+        except BoardError:
+            return "ERR could not create board"
+        except KeyError:
+            return "ERR unknown session"
+        except ValueError:
+            return "ERR coordinates must be numbers"
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line is longer than the StreamReader's limit. The line was thrown away
+                    writer.write(b"ERR line too long\n")
+                    await writer.drain()
+                    continue
+                if not line:
+                    break
+
+                line = line.decode(errors="replace").strip()
+                if not line:
+                    continue
+                if line.upper() == "QUIT":
+                    break
+
+                writer.write((await self._run_command(line) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(cancel_futures=True)
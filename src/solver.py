@@ -0,0 +1,121 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dictionary import WordPool
+from word_search import WordSearch
+
+# Dictionary and boards given to each worker process. Set once by _init_worker, so the workers don't load the
+# dictionary again and the boards aren't sent with every job
+_worker_words = None
+_worker_boards = None
+
+
+def _init_worker(words, mappers):
+    global _worker_words, _worker_boards
+    _worker_words = words
+    _worker_boards = {}
+
+    for number, mapper in enumerate(mappers):
+        word_search = WordSearch()
+        word_search.mapper = [list(row) for row in mapper]
+        _worker_boards[number] = word_search
+
+
+def _solve_shard(job):
+    """
+    Runs inside the process pool. Searches some of the rows of a board for extra words
+
+    :param job:     tuple -- (board number, first row, last row, min_word_width)
+    :return:        tuple -- (board number, number of rays searched, {'word': (x, y, t_x, t_y)})
+    """
+    board, start, end, min_word_width = job
+
+    word_search = _worker_boards[board]
+    rows = range(start, end)
+
+    rays = len(rows) * word_search.width * 8
+    return board, rays, word_search.extra_words(_worker_words, min_word_width, rows)
+
+
+def _shards(boards, shards_per_board):
+    """
+    Splits the boards into rows
+
+    yields board number, first row, last row
+    """
+    for number, word_search in enumerate(boards):
+        shards = min(shards_per_board, word_search.height)
+        for shard in range(shards):
+            yield number, word_search.height * shard // shards, word_search.height * (shard + 1) // shards
+
+
+def solve_boards(boards, words, min_word_width=3, processes=None, progress=None):
+    """
+    Same as WordSearch.extra_words but for many boards, with the work split between processes.
+    Each board is split into rows, so one big board also uses every process.
+
+    :param boards:          list of WordSearch
+    :param words:           WordPool, or any list of words (turned into a WordPool). Given to each process once,
+                            same as the boards
+    :param min_word_width:  int, the min word's width. This is so it doesn't return one letter words
+    :param processes:       int, number of processes. Default is the number of cores
+    :param progress:        function(rays done, total rays, seconds) called after each part is done. Optional
+    :return:                list of dict -- [{'word': (x, y, t_x, t_y)}] -- Same order as boards
+    """
+    if not isinstance(words, WordPool):
+        words = WordPool(set(words))
+    processes = processes or os.cpu_count() or 1
+
+    # Splitting each board into a few parts per process, so the processes finish around the same time
+    jobs = [(*shard, min_word_width) for shard in _shards(boards, processes * 4)]
+    total = sum(word_search.width * word_search.height * 8 for word_search in boards)
+
+    results = [{} for _ in boards]
+    done = 0
+    start = time.perf_counter()
+    # Each board is sent to the processes once. The jobs only say which rows to search
+    mappers = [["".join(row) for row in word_search.mapper] for word_search in boards]
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(words, mappers)) as executor:
+        # map keeps the order of the jobs. Merging in order gives the same result as extra_words
+        for board, rays, extra in executor.map(_solve_shard, jobs):
+            results[board].update(extra)
+            done += rays
+            if progress is not None:
+                progress(done, total, time.perf_counter() - start)
+
+    return results
+
+
+def solve(word_search, words, min_word_width=3, processes=None, progress=None):
+    """
+    Same as WordSearch.extra_words, with the work split between processes.
+    For more information about the parameters, check solve_boards's documentation
+
+    :return: dict -- {'word': (x, y, t_x, t_y)} -- Words that was found
+    """
+    return solve_boards([word_search], words, min_word_width, processes, progress)[0]
+
+
+def load_boards(filename):
+    """
+    Loads the boards saved with WordSearch.to_dict. One json object per line.
+    Recordings from main.py --record also work, since the first line is the board.
+
+    :param filename:    str, name of file to open
+    :return:            list of WordSearch
+    """
+    boards = []
+    with open(filename, 'r') as fp:
+        for line in fp:
+            if not line.strip():
+                continue
+
+            data = json.loads(line)
+            if "board" in data:
+                data = data["board"]
+            if "mapper" in data:
+                boards.append(WordSearch.from_dict(data))
+
+    return boards
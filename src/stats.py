@@ -0,0 +1,11 @@
+def percentile(values, percent):
+    """
+    Nearest rank percentile
+
+    :param values:  list of numbers
+    :param percent: int, like 99 for p99
+    :return:        number
+    """
+    values = sorted(values)
+    index = max(0, round(len(values) * percent / 100) - 1)
+    return values[index]
@@ -0,0 +1,105 @@
+from bisect import bisect_right
+
+
+class WordPanel:
+    """
+    Keeps track of the word list shown under the grid.
+
+    The words are split into rows that fit the width. The line breaks are cached and only worked out again
+    when the width changes. Rows are only turned into strings when they are shown, and are cached until
+    a word in that row gets found.
+    """
+    __slots__ = ("terminal", "placements", "words", "index", "widths", "width", "breaks", "rendered")
+
+    separator = ", "
+
+    def __init__(self, terminal, placements):
+        """
+        :param terminal:    blessed.Terminal, used for the colors and display width of the words
+        :param placements:  dict, WordSearch.words. Used to check if the word is found
+        """
+        self.terminal = terminal
+        self.placements = placements
+
+        self.words = list(placements)
+        self.index = {word: i for i, word in enumerate(self.words)}  # 'word': position in self.words
+        # Display width of each word. Using terminal.length since len() doesn't work with wide characters
+        self.widths = [self.terminal.length(word) for word in self.words]
+
+        self.width = 0
+        self.breaks = []    # Index of the first word in each row
+        self.rendered = {}  # row - string, rows that have been turned into strings
+
+    @property
+    def row_count(self):
+        return len(self.breaks)
+
+    def _row_of(self, word_index):
+        return bisect_right(self.breaks, word_index) - 1
+
+    def _layout(self):
+        """Works out the line breaks for every row"""
+        self.breaks = []
+        cur_width = 0
+        for i, width in enumerate(self.widths):
+            # Adding 2 for the separator
+            word_width = width + len(self.separator)
+
+            # Adding the word by checking if it can fit in the current row
+            if i == 0 or self.width <= cur_width + word_width:
+                self.breaks.append(i)
+                cur_width = word_width
+            else:
+                cur_width += word_width
+
+    def resize(self, width):
+        """
+        Sets the width of the panel. Works out all the line breaks again if the width changed
+
+        :param width: int, how wide a row can be
+        """
+        if width == self.width and (self.breaks or not self.words):
+            return
+
+        self.width = width
+        self.rendered = {}
+        self._layout()
+
+    def update(self, word):
+        """
+        Call this when a word gets found. Only that word's row is shown again.
+        The color doesn't change the word's width, so the line breaks stay the same.
+
+        :param word: str, the word that changed
+        """
+        row = self._row_of(self.index[word])
+        self.rendered.pop(row, None)
+
+    def _render(self, row):
+        start = self.breaks[row]
+        end = self.breaks[row + 1] if row + 1 < len(self.breaks) else len(self.words)
+
+        words = []
+        for word in self.words[start:end]:
+            # Checking if the word is found
+            if self.placements[word].found:
+                word = self.terminal.white_on_blue(word)
+            words.append(word)
+
+        return self.separator.join(words)
+
+    def rows(self, start, count):
+        """
+        Grabs the rows as strings. Only the rows asked for are created
+
+        :param start:   int, first row
+        :param count:   int, how many rows
+        :return:        list of str
+        """
+        rows = []
+        for row in range(start, min(start + count, len(self.breaks))):
+            if row not in self.rendered:
+                self.rendered[row] = self._render(row)
+            rows.append(self.rendered[row])
+
+        return rows
@@ -1,5 +1,9 @@
+import math
+import os
 import random
-import json
+from concurrent.futures import ProcessPoolExecutor
+
+from dictionary import load_words
 
 
 class OutOfBounds(Exception):
@@ -7,7 +11,57 @@ class OutOfBounds(Exception):
     pass
 
 
+# Every direction a word can go. Placement keeps a reference to one of these rather than its own (t_x, t_y) tuple
+DIRECTIONS = {(t_x, t_y): (t_x, t_y) for t_x in range(-1, 2) for t_y in range(-1, 2) if (t_x, t_y) != (0, 0)}
+
+
+class Placement:
+    """
+    Where a word was placed in mapper and if the user found it.
+
+    Still works like the old list, [(x, y), (x, y), bool], so placement[2] is the same as placement.found
+    """
+    __slots__ = ("start", "end", "direction", "found")
+
+    def __init__(self, start, end, direction, found=False):
+        self.start = start          # (x, y) of the first letter
+        self.end = end              # (x, y) of the last letter
+        self.direction = DIRECTIONS[tuple(direction)]  # (t_x, t_y) -- how much x, y changes every letter
+        self.found = found          # If the user found the word
+
+    def __getitem__(self, index):
+        return (self.start, self.end, self.found)[index]
+
+    def __setitem__(self, index, value):
+        # Converting the index to the attribute name. Allows negative indexes like a list
+        name = ("start", "end", "found")[index]
+        setattr(self, name, value)
+
+    def __len__(self):
+        return 3
+
+    def __iter__(self):
+        return iter((self.start, self.end, self.found))
+
+    def __eq__(self, other):
+        if isinstance(other, Placement):
+            return (self.start, self.end, self.direction, self.found) == \
+                   (other.start, other.end, other.direction, other.found)
+        if isinstance(other, (list, tuple)):
+            # Comparing with the old list, [(x, y), (x, y), bool]
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    # Placement changes when the word is found, so it can't be hashed (same as the old list)
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Placement({self.start}, {self.end}, {self.direction}, {self.found})"
+
+
 class WordSearch:
+    __slots__ = ("mapper", "words")
+
     # Configuration Variables
     __empty_char = "."                 # Empty char. Will be used to determine if a position on the map is empty
     __letters = (ord('a'), ord('z'))   # Will help determine the range for random characters (97(a) -> 122(z) for UTF-8)
@@ -15,7 +69,7 @@ class WordSearch:
     def __init__(self):
         self.mapper = None  # Will keep track of the grid of characters. Note (y, x) not (x, y)
         self.words = {      # Keep track of words that have been placed in mapper
-            # 'word': ((x,y), (x,y), bool) # Word is located at (x, y) to (x, y) and if the user found the word (bool)
+            # 'word': Placement # Word is located at (x, y) to (x, y) and if the user found the word (bool)
         }
 
     @property
@@ -145,80 +199,134 @@ class WordSearch:
         self._expand_x(width)
         self._expand_y(height)
 
-    def extra_words(self, words, min_word_width=3):
+    def rays(self, rows=None):
+        """
+        Goes through every position and direction in mapper.
+
+        :param rows:    range, which rows (y) to go through. Default is every row
+        yields x, y, t_x, t_y
+        """
+        if rows is None:
+            rows = range(self.height)
+
+        for y in rows:
+            for x in range(self.width):
+                # grabbing t_x and t_y. Easier to keep track with for loops
+                for t_x in range(-1, 2):
+                    for t_y in range(-1, 2):
+                        if t_x == 0 and t_y == 0:
+                            continue
+                        yield x, y, t_x, t_y
+
+    def _grab_ray(self, x, y, t_x, t_y):
+        """Grabs the letters from x, y going towards t_x, t_y until the end of mapper"""
+        # How many letters there are until the end of mapper, for both x and y
+        lengths = []
+        for position, adding, size in ((x, t_x, self.width), (y, t_y, self.height)):
+            if adding > 0:
+                lengths.append(size - position)
+            elif adding < 0:
+                lengths.append(position + 1)
+
+        return self._grab_range(x, y, t_x, t_y, min(lengths))
+
+    def extra_words(self, words, min_word_width=3, rows=None):
         """
         Searches through the whole mapper looking for extra words.
 
         Note, this is inefficient, it will take a while to go through everything.
+        Use solver.solve to split the work between processes.
+
+        If words has a has_prefix method (like dictionary.WordPool), it stops going down a direction when
+        no word starts with the letters so far.
+
+        Note, older versions skipped going down (t_x, t_y = 0, 1). That direction is searched now, so it can find
+        more words than audits made with older versions.
 
         :param words:           list, dict, what words to look for
         :param min_word_width:  int, the min word's width. This is so it doesn't return one letter words
+        :param rows:            range, which rows (y) to search. Default is every row
         :return:                dict -- {'word': (x, y, t_x, t_y)} -- Words that was found
         """
-        # TODO: Maybe have it check min / width so it knows the range. Rather than just guessing and waiting for
-        #   OutOfBounds exception
+        has_prefix = getattr(words, "has_prefix", None)
 
         extra = {  # will contain the extra words found
             # 'word': (x, y, t_x, t_y)
         }
-        height, width = len(self.mapper), len(self.mapper[0])
-        x, y = 0, 0
-        while y < height:
-            # grabbing t_x and t_y. Easier to keep track with for loops
-            for t_x in range(-1, 2):
-                for t_y in range(-1, 2):
-                    if t_x == 0 and t_y == 0:
-                        break
-                    to_range = min_word_width
-                    # grabbing the word
-                    while True:
-                        try:
-                            word = self._grab_range(x, y, t_x, t_y, to_range)
-                        except OutOfBounds:
-                            break
-                        else:
-                            if word in words:
-                                extra[word] = (x, y, t_x, t_y)
-                            to_range += 1
-            if x >= width:
-                x = 0
-                y += 1
-            else:
-                x += 1
+        for x, y, t_x, t_y in self.rays(rows):
+            ray = self._grab_ray(x, y, t_x, t_y)
+            # grabbing the word
+            for to_range in range(1, len(ray) + 1):
+                word = ray[:to_range]
+                if has_prefix is not None and not has_prefix(word):
+                    break
+                if to_range >= min_word_width and word in words:
+                    extra[word] = (x, y, t_x, t_y)
 
         return extra
 
-    @classmethod
-    def generate(cls, words=None, height=10, width=10, num_of_words=10, min_word_width=3, extend_by=5,
-                 add_letters=True):
+    @staticmethod
+    def check_config(height=10, width=10, num_of_words=10, min_word_width=3, extend_by=5, **_):
         """
-        Create the word search game
-        :param words: List of words to use
-        ----- configuration -----
-        :param height:              height to start with
-        :param width:               width to start with
-        :param num_of_words:        number of words to add
-        :param min_word_width:      minimum length for words
-        :param extend_by:           When there is no room, how much to expand by (x and y)
-        :param add_letters:         Add random letters to empty spaces or not. This is mostly used for debugging.
-                                    Could also be used to see which is the best configuration.
-
-        :return: WordSearch
+        Checks the configuration given to generate. Raises ValueError if something is wrong.
+        For more information about the parameters, check generate's documentation
         """
         if height <= 0 or width <= 0 or num_of_words <= 0 or min_word_width <= 0 or extend_by <= 0:
             raise ValueError("All parameters must be greater than 0")
 
-        self = cls()
+    @staticmethod
+    def check_words(words, num_of_words=10, min_word_width=3, **_):
+        """
+        Checks there are enough words for generate to pick from. Raises ValueError if there isn't.
+        For more information about the parameters, check generate's documentation
+        """
+        usable = len({word for word in words if len(word) >= min_word_width})
+        if usable < num_of_words:
+            raise ValueError(f"Only {usable} words have at least {min_word_width} letters. "
+                             f"Need {num_of_words} words")
 
-        # Creating the mapper
-        self._expand_mapper(width, height)
+    @staticmethod
+    def _pick_words(words, num_of_words, min_word_width, rng=random):
+        """
+        Grabs random words to add to the mapper
+
+        :param words:           List of words to pick from
+        :param num_of_words:    number of words to pick
+        :param min_word_width:  minimum length for words
+        :param rng:             random.Random or the random module. Used for every random number
+        :return:                list of words
+        """
+        if not words:
+            raise ValueError("There are no words to pick from")
 
-        # Grabbing random words depending on num_of_words
         words_list = []
+        picked = set()  # Same as words_list. Checking a set is faster than checking the list
+        tries = 0
         while len(words_list) < num_of_words:
-            temp = random.choice(words)
-            if len(temp) >= min_word_width and temp not in words_list:
+            tries += 1
+            if tries == num_of_words * 100:
+                # Taking a while. Making sure there are enough words, otherwise this would never stop
+                WordSearch.check_words(words, num_of_words, min_word_width)
+
+            temp = rng.choice(words)
+            if len(temp) >= min_word_width and temp not in picked:
                 words_list.append(temp)
+                picked.add(temp)
+
+        return words_list
+
+    def _place_words(self, words_list, extend_by, rng=random, expand=True):
+        """
+        Adds the words to mapper at random positions
+
+        :param words_list:  list of words to add
+        :param extend_by:   When there is no room, how much to expand by (x and y)
+        :param rng:         random.Random or the random module. Used for every random number
+        :param expand:      Expand the mapper when a word can't fit. If False, the word is skipped instead
+        :return:            list of words that couldn't fit. Always empty if expand is True
+        """
+        skipped = []
+        words_list = list(words_list)
 
         # Adding the words to __mapper
         while len(words_list) != 0:
@@ -229,8 +337,8 @@ class WordSearch:
                 # (x, y, t_x, t_y)
             ]
             for _ in range(19999):
-                x, y = random.randrange(0, len(self.mapper[0])), random.randrange(0, len(self.mapper))
-                t_x, t_y = random.randint(-1, 1), random.randint(-1, 1)
+                x, y = rng.randrange(0, len(self.mapper[0])), rng.randrange(0, len(self.mapper))
+                t_x, t_y = rng.randint(-1, 1), rng.randint(-1, 1)
 
                 if self._check_word(x, y, t_x, t_y, word):
                     # if (x, y, t_x, t_y) not in positions:
@@ -239,7 +347,7 @@ class WordSearch:
             if positions:
                 # pos = (x, y, t_x, t_y)
                 # Grabbing a random position from the list
-                pos = random.choice(positions)
+                pos = rng.choice(positions)
                 # Adding the word to the mapper
                 self._set_range(*pos, string=word)
                 end_pos = (
@@ -247,40 +355,220 @@ class WordSearch:
                     pos[1] + pos[3] * (len(word) - 1)
                 )
                 # Adding the word to __words to be used to check where the word is at
-                self.words[word] = [(pos[0], pos[1]), end_pos, False]
+                self.words[word] = Placement((pos[0], pos[1]), end_pos, (pos[2], pos[3]))
                 # Done with the word, remove it
                 words_list.pop(0)
-            else:
+            elif expand:
                 # Word can't fit. Expand the mapper
                 self._expand_mapper(extend_by, extend_by)
+            else:
+                # Word can't fit. Leaving it for someone else to add
+                skipped.append(words_list.pop(0))
+
+        return skipped
+
+    def _add_letters(self, rng=random):
+        """Adds random letters to the empty spaces"""
+        for y, row in enumerate(self.mapper):
+            for x, letter in enumerate(row):
+                if letter == self.__empty_char:
+                    char = rng.randint(self.__letters[0], self.__letters[1])
+                    self._set_char(x, y, chr(char))
+
+    @classmethod
+    def generate(cls, words=None, height=10, width=10, num_of_words=10, min_word_width=3, extend_by=5,
+                 add_letters=True):
+        """
+        Create the word search game
+        :param words: List of words to use
+        ----- configuration -----
+        :param height:              height to start with
+        :param width:               width to start with
+        :param num_of_words:        number of words to add
+        :param min_word_width:      minimum length for words
+        :param extend_by:           When there is no room, how much to expand by (x and y)
+        :param add_letters:         Add random letters to empty spaces or not. This is mostly used for debugging.
+                                    Could also be used to see which is the best configuration.
+
+        :return: WordSearch
+        """
+        cls.check_config(height, width, num_of_words, min_word_width, extend_by)
+
+        self = cls()
+
+        # Creating the mapper
+        self._expand_mapper(width, height)
+
+        # Grabbing random words depending on num_of_words
+        words_list = cls._pick_words(words, num_of_words, min_word_width)
+        self._place_words(words_list, extend_by)
+
+        if add_letters:
+            self._add_letters()
+
+        return self
+
+    @staticmethod
+    def _split_regions(processes, width, height):
+        """
+        Grabs how many columns and rows to split the mapper into, so columns * rows == processes.
+        Picks the pair closest to a square. If the mapper is too small for that many regions, uses less processes.
+
+        :param processes:   int, number of regions wanted
+        :param width:       int, width of the mapper
+        :param height:      int, height of the mapper
+        :return:            tuple -- (columns, rows)
+        """
+        for regions in range(processes, 0, -1):
+            # Going from the middle, so the first pair that fits is the closest to a square
+            for rows in range(math.isqrt(regions), 0, -1):
+                if regions % rows != 0:
+                    continue
+                columns = regions // rows
+                # Wider mapper gets more columns
+                if width < height:
+                    columns, rows = rows, columns
+                if columns <= width and rows <= height:
+                    return columns, rows
+
+        return 1, 1
+
+    @classmethod
+    def generate_parallel(cls, words=None, height=10, width=10, num_of_words=10, min_word_width=3, extend_by=5,
+                          add_letters=True, processes=None, seed=None):
+        """
+        Same as generate, but splits the mapper into regions and adds each region's words in a separate process.
+        This is for huge word searches, with thousands of words.
+
+        Each region gets its own random.Random. Words that don't fit in any region, are added at the end
+        on the whole mapper. These are the words that can cross between regions.
+
+        For more information about the other parameters, check generate's documentation
+        :param processes:   int, number of processes / regions. Default is the number of cores
+        :param seed:        Seed for the random numbers. Same seed and processes gives the same word search
+
+        :return: WordSearch
+        """
+        cls.check_config(height, width, num_of_words, min_word_width, extend_by)
+        processes = processes or os.cpu_count() or 1
+        rng = random.Random(seed)
+
+        self = cls()
+        words_list = cls._pick_words(words, num_of_words, min_word_width, rng)
+
+        # Making the mapper big enough for every word. About half of the mapper will be the words
+        size = math.ceil(math.sqrt(sum(len(word) for word in words_list) * 2))
+        width, height = max(width, size), max(height, size)
+        self._expand_mapper(width, height)
+
+        # Splitting the mapper into columns x rows regions. One region for each process
+        columns, rows = self._split_regions(processes, width, height)
+        regions = [
+            # (x, y, width, height)
+        ]
+        for row in range(rows):
+            for column in range(columns):
+                x, y = width * column // columns, height * row // rows
+                regions.append((x, y, width * (column + 1) // columns - x, height * (row + 1) // rows - y))
+
+        # Giving each region the same amount of words. Words longer than the regions are added at the end
+        shares = [[] for _ in regions]
+        leftover = []
+        for k, word in enumerate(words_list):
+            region = regions[k % len(regions)]
+            if len(word) <= max(region[2], region[3]):
+                shares[k % len(regions)].append(word)
+            else:
+                leftover.append(word)
+
+        jobs = [
+            # (width, height, words, extend_by, seed)
+            (region[2], region[3], share, extend_by, rng.randrange(2 ** 32)) for region, share in zip(regions, shares)
+        ]
+        if len(regions) == 1:
+            results = map(_place_region, jobs)
+        else:
+            with ProcessPoolExecutor(len(regions)) as executor:
+                results = list(executor.map(_place_region, jobs))
+
+        # Copying each region to the mapper
+        for (x, y, _, _), (mapper, placements, skipped) in zip(regions, results):
+            for number, row in enumerate(mapper):
+                self.mapper[y + number][x:x + len(row)] = row
+
+            for word, (start, end, direction) in placements.items():
+                self.words[word] = Placement((start[0] + x, start[1] + y), (end[0] + x, end[1] + y), direction)
+            leftover += skipped
+
+        # Adding the words that didn't fit. These can go across regions
+        self._place_words(leftover, extend_by, rng)
 
         if add_letters:
-            for y, row in enumerate(self.mapper):
-                for x, letter in enumerate(row):
-                    if letter == self.__empty_char:
-                        char = random.randint(self.__letters[0], self.__letters[1])
-                        self._set_char(x, y, chr(char))
+            self._add_letters(rng)
 
+        # Keeping the same order as words_list
+        self.words = {word: self.words[word] for word in words_list}
         return self
 
     @classmethod
-    def generate_json(cls, filename, **kwargs):
+    def generate_json(cls, filename, processes=None, **kwargs):
         """
-        Create the word search game with .json file.
+        Create the word search game with a dictionary file.
         This was made to open a .json file in https://github.com/dwyl/english-words
+        Text files with one word per line, and gzip files, also work. Check dictionary.read_words
 
         This uses generate to create the word search game.
-        Just opens the file and gives it to generate as words
+        The file is read a bit at a time by dictionary.load_words, then given to generate as words
 
         :param filename:  str, name of file to open
+        :param processes: int, if given, uses WordSearch.generate_parallel with this many processes
         :param kwargs:    **kwargs given to WordSearch.generate
         :return:          WordSearch
         """
-        with open(filename, 'r') as fp:
-            words = list(json.load(fp))
+        words = load_words(filename, min_word_width=kwargs.get("min_word_width", 3))
 
+        if processes is not None:
+            return cls.generate_parallel(words, processes=processes, **kwargs)
         return cls.generate(words, **kwargs)
 
+    def to_dict(self):
+        """
+        Turns the board into a dict that can be saved with json. Use from_dict to load it again
+
+        :return: dict -- {'mapper': ['row', ...], 'words': {'word': [[x, y], [x, y], [t_x, t_y], bool]}}
+        """
+        return {
+            "mapper": ["".join(row) for row in self.mapper],
+            "words": {k: [v.start, v.end, v.direction, v.found] for k, v in self.words.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Loads a board made by to_dict
+
+        :param data:    dict, from to_dict
+        :return:        WordSearch
+        """
+        self = cls()
+        self.mapper = [list(row) for row in data["mapper"]]
+        for word, (start, end, direction, found) in data["words"].items():
+            self.words[word] = Placement(tuple(start), tuple(end), tuple(direction), found)
+
+        return self
+
+    def find_word(self, x, y, s_x, s_y):
+        """
+        Grabs the word placed at the coordinates. This doesn't mark the word as found
+
+        For more information about the parameters, check answer's documentation
+        :return:        str, the word or None if there isn't a word there
+        """
+        for k, v in self.words.items():
+            if v.start == (x, y) and v.end == (s_x, s_y):
+                return k
+        return None
+
     def answer(self, x, y, s_x, s_y):
         """
         Find a word on the grid
@@ -291,11 +579,12 @@ class WordSearch:
         :param s_y:     Ending y
         :return:        found    - bool, if the word is at the coordinates / user found it
         """
-        for k, v in self.words.items():
-            if v[0] == (x, y) and v[1] == (s_x, s_y):
-                v[2] = True
-                return True
-        return False
+        word = self.find_word(x, y, s_x, s_y)
+        if word is None:
+            return False
+
+        self.words[word].found = True
+        return True
 
     def to_string(self):
         # this is a bit confusing statement. Basically, its getting the width of the number and adding it by 2
@@ -327,3 +616,20 @@ class WordSearch:
         string += f"\n{', '.join(self.words)}"
 
         return string
+
+
+def _place_region(job):
+    """
+    Runs inside the process pool for WordSearch.generate_parallel. Adds words to one region
+
+    :param job:     tuple -- (width, height, words, extend_by, seed)
+    :return:        tuple -- (mapper, {'word': ((x, y), (x, y), (t_x, t_y))}, list of words that didn't fit)
+    """
+    width, height, words, extend_by, seed = job
+
+    region = WordSearch()
+    region._expand_mapper(width, height)
+    skipped = region._place_words(words, extend_by, random.Random(seed), expand=False)
+
+    placements = {k: (v.start, v.end, v.direction) for k, v in region.words.items()}
+    return region.mapper, placements, skipped